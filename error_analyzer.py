@@ -3,28 +3,332 @@
 AI-Powered Error Analysis using FREE Groq API
 """
 
+import asyncio
 import os
+import re
 import sys
-import json
+from collections import OrderedDict
 from datetime import datetime
 
-def analyze_error_with_groq(error_message):
-    """Analyze error using FREE Groq API"""
-    try:
+try:
+    import orjson
+    
+    def _dumps(obj, indent=False):
+        """Serialize obj to a JSON str with orjson"""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode()
+    
+    _loads = orjson.loads
+except ImportError:
+    import json
+    
+    def _dumps(obj, indent=False):
+        """Serialize obj to a JSON str with the standard library"""
+        return json.dumps(obj, indent=2 if indent else None)
+    
+    _loads = json.loads
+
+# Responses worth retrying: rate limiting and transient server errors
+GROQ_RETRY_STATUSES = (429, 500, 502, 503, 504)
+GROQ_MAX_RETRIES = 2
+GROQ_BACKOFF_FACTOR = 0.3
+# Clamp Retry-After to this many seconds rather than stall the pipeline
+GROQ_MAX_RETRY_AFTER = 10
+
+_SESSION = None
+
+
+def _get_session():
+    """Return a shared requests session so Groq calls reuse keep-alive connections"""
+    global _SESSION
+    if _SESSION is None:
         import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
         
-        api_key = os.getenv('GROQ_API_KEY')
-        if not api_key:
-            return None
+        class CappedRetry(Retry):
+            """urllib3 Retry that clamps Retry-After like the async path does"""
+            
+            def get_retry_after(self, response):
+                retry_after = super().get_retry_after(response)
+                if retry_after is None:
+                    return None
+                return min(retry_after, GROQ_MAX_RETRY_AFTER)
         
-        url = "https://api.groq.com/openai/v1/chat/completions"
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=10,
+            # Retry connection failures and 429/5xx only; a read timeout means the
+            # model was generating, and retrying it would multiply the wait
+            max_retries=CappedRetry(
+                total=GROQ_MAX_RETRIES,
+                read=0,
+                backoff_factor=GROQ_BACKOFF_FACTOR,
+                status_forcelist=GROQ_RETRY_STATUSES,
+                allowed_methods=frozenset(['POST']),
+                raise_on_status=False
+            )
+        )
+        session.mount('https://', adapter)
+        session.headers.update({"Content-Type": "application/json"})
+        _SESSION = session
+    return _SESSION
+
+
+GROQ_URL = "https://api.groq.com/openai/v1/chat/completions"
+
+CACHE_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'auto-deploy', 'groq.json')
+CACHE_MAX_ENTRIES = 512
+
+# Parts of an error message that change between runs without changing the fix
+_VOLATILE_RE = re.compile(r'(File "[^"]+", line \d+|0x[0-9a-f]+|/tmp/\S+)')
+
+
+def _normalize_error(error_message):
+    """Strip file paths, line numbers and addresses so recurring errors share a cache key"""
+    return _VOLATILE_RE.sub('', error_message).strip()
+
+
+def _load_cache():
+    """Load previously cached Groq analyses from disk"""
+    try:
+        with open(CACHE_PATH, 'r', encoding='utf-8') as f:
+            entries = _loads(f.read())
+    except (OSError, ValueError):
+        return OrderedDict()
+    
+    if not isinstance(entries, dict):
+        return OrderedDict()
+    # Values are JSON strings; anything else was not written by _cache_put
+    valid = [(key, value) for key, value in entries.items() if isinstance(value, str)]
+    return OrderedDict(valid[-CACHE_MAX_ENTRIES:])
+
+
+def _save_cache():
+    """Write the cache to disk so later runs can reuse it"""
+    try:
+        os.makedirs(os.path.dirname(CACHE_PATH), exist_ok=True)
+        tmp_path = f"{CACHE_PATH}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(_dumps(_CACHE))
+        os.replace(tmp_path, CACHE_PATH)
+    except OSError as e:
+        print(f"Could not save Groq cache: {e}", file=sys.stderr)
+
+
+def _cache_get(key):
+    """Return a fresh copy of the cached analysis for key, or None"""
+    cached = _CACHE.get(key)
+    if cached is None:
+        return None
+    try:
+        ai_suggestions = _loads(cached)
+    except (TypeError, ValueError):
+        # A corrupt entry is a miss, never a crash; drop it so it gets refreshed
+        del _CACHE[key]
+        return None
+    _CACHE.move_to_end(key)
+    return ai_suggestions
+
+
+def _cache_put(key, ai_suggestions):
+    """Store an analysis, evicting the least recently used entries"""
+    try:
+        _CACHE[key] = _dumps(ai_suggestions)
+    except (TypeError, ValueError):
+        return
+    _CACHE.move_to_end(key)
+    while len(_CACHE) > CACHE_MAX_ENTRIES:
+        _CACHE.popitem(last=False)
+
+
+# Normalized error message -> JSON encoded AI suggestions, oldest first
+_CACHE = _load_cache()
+
+
+SEMANTIC_MODEL = 'all-MiniLM-L6-v2'
+SEMANTIC_THRESHOLD = 0.92
+# Embeddings and responses share one file so a concurrent writer can never split them
+SEMANTIC_CACHE_PATH = os.path.join(os.path.dirname(CACHE_PATH), 'semantic.npz')
+SEMANTIC_MAX_ENTRIES = 5000
+
+# Loaded on first use; False once we know sentence-transformers is unavailable
+_EMBEDDER = None
+# (embedding matrix, [[error_type, JSON encoded AI suggestions], ...]) rows in step
+_SEMANTIC = None
+
+# From this many entries a FAISS inner-product index replaces the NumPy matmul
+FAISS_MIN_ENTRIES = 1000
+# FAISS index over the rows of the embedding matrix; False if faiss is unavailable
+_FAISS_INDEX = None
+
+
+def _extract_error_type(error_message):
+    """Return the token before ':' (e.g. KeyError), or Unknown"""
+    return error_message.split(':')[0].strip() if ':' in error_message else "Unknown"
+
+
+def _get_embedder():
+    """Lazily load the sentence embedding model, or return None if unavailable"""
+    global _EMBEDDER
+    if _EMBEDDER is None:
+        try:
+            from sentence_transformers import SentenceTransformer
+            _EMBEDDER = SentenceTransformer(SEMANTIC_MODEL)
+        except ImportError:
+            _EMBEDDER = False
+        except Exception as e:
+            print(f"Semantic cache disabled: {e}", file=sys.stderr)
+            _EMBEDDER = False
+    return _EMBEDDER or None
+
+
+def _disable_semantic_cache(e):
+    """Turn the semantic layer off for this run after an unexpected error"""
+    global _EMBEDDER
+    print(f"Semantic cache disabled: {e}", file=sys.stderr)
+    _EMBEDDER = False
+
+
+def _load_semantic_cache(dimension):
+    """Load the stored embeddings and their responses from disk"""
+    import numpy as np
+    
+    try:
+        with np.load(SEMANTIC_CACHE_PATH, allow_pickle=False) as data:
+            embeddings = data['embeddings']
+            responses = _loads(str(data['responses'][0]))
+    except (OSError, ValueError, KeyError, IndexError):
+        return None, []
+    
+    # A different model (or a damaged file) leaves rows that cannot be compared
+    if embeddings.ndim != 2 or embeddings.shape[1] != dimension or len(embeddings) != len(responses):
+        return None, []
+    return embeddings[-SEMANTIC_MAX_ENTRIES:], responses[-SEMANTIC_MAX_ENTRIES:]
+
+
+def _save_semantic_cache():
+    """Persist the embedding matrix and responses for later runs"""
+    import numpy as np
+    
+    embeddings, responses = _SEMANTIC
+    try:
+        os.makedirs(os.path.dirname(SEMANTIC_CACHE_PATH), exist_ok=True)
+        tmp_path = f"{SEMANTIC_CACHE_PATH}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            np.savez(f, embeddings=embeddings, responses=np.array([_dumps(responses)]))
+        os.replace(tmp_path, SEMANTIC_CACHE_PATH)
+    except (OSError, ValueError) as e:
+        print(f"Could not save semantic cache: {e}", file=sys.stderr)
+
+
+def _embed(error_message):
+    """Return the normalized embedding for an error, or None if unavailable"""
+    global _SEMANTIC
+    embedder = _get_embedder()
+    if embedder is None:
+        return None
+    try:
+        if _SEMANTIC is None:
+            _SEMANTIC = _load_semantic_cache(embedder.get_sentence_embedding_dimension())
+        return embedder.encode(_normalize_error(error_message), normalize_embeddings=True)
+    except Exception as e:
+        _disable_semantic_cache(e)
+        return None
+
+
+def _get_faiss_index(embeddings):
+    """Return a FAISS index over the embeddings, building it on first use, or None"""
+    global _FAISS_INDEX
+    if _FAISS_INDEX is None:
+        try:
+            import faiss
+            import numpy as np
+        except ImportError:
+            _FAISS_INDEX = False
+            return None
+        # Embeddings are normalized, so inner product is cosine similarity
+        _FAISS_INDEX = faiss.IndexFlatIP(embeddings.shape[1])
+        _FAISS_INDEX.add(np.ascontiguousarray(embeddings, dtype=np.float32))
+    return _FAISS_INDEX or None
+
+
+def _nearest_entries(embeddings, embedding):
+    """Yield (similarity, row) for cached embeddings, most similar first"""
+    index = _get_faiss_index(embeddings) if len(embeddings) >= FAISS_MIN_ENTRIES else None
+    if index is not None:
+        import numpy as np
         
-        headers = {
-            "Authorization": f"Bearer {api_key}",
-            "Content-Type": "application/json"
-        }
+        query = np.ascontiguousarray(embedding.reshape(1, -1), dtype=np.float32)
+        # Every entry above the threshold, not a fixed top-k, so a hit never depends
+        # on how many near matches of another error type the cache happens to hold
+        lims, sims, rows = index.range_search(query, SEMANTIC_THRESHOLD)
+        sims, rows = sims[lims[0]:lims[1]], rows[lims[0]:lims[1]]
+        for j in sims.argsort()[::-1]:
+            yield sims[j], rows[j]
+        return
+    
+    sims = embeddings @ embedding
+    for row in sims.argsort()[::-1]:
+        yield sims[row], row
+
+
+def _semantic_get(error_message, embedding):
+    """Return a cached analysis for a similar error of the same type, or None"""
+    if embedding is None or not _EMBEDDER:
+        return None
+    embeddings, responses = _SEMANTIC
+    if embeddings is None:
+        return None
+    
+    try:
+        error_type = _extract_error_type(error_message)
+        # Similar wording is not enough: "KeyError: x" and "NameError: x" need different fixes
+        for sim, i in _nearest_entries(embeddings, embedding):
+            if sim <= SEMANTIC_THRESHOLD:
+                break
+            if responses[i][0] == error_type:
+                return _loads(responses[i][1])
+    except Exception as e:
+        _disable_semantic_cache(e)
+    return None
+
+
+def _semantic_put(error_message, embedding, ai_suggestions):
+    """Add an analysis to the semantic cache; returns True if it was stored"""
+    global _SEMANTIC, _FAISS_INDEX
+    
+    if embedding is None or not _EMBEDDER:
+        return False
+    try:
+        import numpy as np
         
-        prompt = f"""Analyze this programming error and provide fix suggestions.
+        embeddings, responses = _SEMANTIC
+        row = embedding.reshape(1, -1).astype(np.float32)
+        embeddings = row if embeddings is None else np.vstack([embeddings, row])
+        entry = [_extract_error_type(error_message), _dumps(ai_suggestions)]
+    except Exception as e:
+        _disable_semantic_cache(e)
+        return False
+    
+    if _FAISS_INDEX:
+        _FAISS_INDEX.add(row)
+    responses.append(entry)
+    
+    # Drop the oldest entries past the limit; the FAISS index is rebuilt on next use
+    if len(responses) > SEMANTIC_MAX_ENTRIES:
+        embeddings = embeddings[-SEMANTIC_MAX_ENTRIES:]
+        responses = responses[-SEMANTIC_MAX_ENTRIES:]
+        if _FAISS_INDEX:
+            _FAISS_INDEX = None
+    _SEMANTIC = (embeddings, responses)
+    return True
+
+
+def _build_groq_payload(error_message):
+    """Build the chat completion request body for an error message"""
+    
+    prompt = f"""Analyze this programming error and provide fix suggestions.
 
 Error: {error_message}
 
@@ -38,118 +342,277 @@ Provide a JSON response with:
 
 Respond with valid JSON only, no markdown formatting."""
 
-        data = {
-            "model": "llama-3.3-70b-versatile",
-            "messages": [
-                {
-                    "role": "system",
-                    "content": "You are an expert software debugging assistant. Provide clear, actionable solutions in valid JSON format."
-                },
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ],
-            "temperature": 0.7,
-            "max_tokens": 1500
+    return {
+        "model": "llama-3.3-70b-versatile",
+        "messages": [
+            {
+                "role": "system",
+                "content": "You are an expert software debugging assistant. Provide clear, actionable solutions in valid JSON format."
+            },
+            {
+                "role": "user",
+                "content": prompt
+            }
+        ],
+        "temperature": 0.7,
+        "max_tokens": 1500
+    }
+
+
+def _parse_groq_response(result):
+    """
+    Extract the AI suggestions from a Groq chat completion response
+    
+    Returns (ai_suggestions, is_json); is_json is False when the reply could
+    not be parsed and is passed through as {"analysis": text}.
+    """
+    ai_text = result['choices'][0]['message']['content']
+    
+    ai_text = ai_text.strip()
+    
+    # Most responses are plain JSON, so try that before any cleanup
+    try:
+        return _loads(ai_text), True
+    except ValueError:
+        pass
+    
+    # Otherwise pull the JSON object out of any markdown fences or prose
+    start = ai_text.find('{')
+    end = ai_text.rfind('}')
+    if start >= 0 and end > start:
+        try:
+            return _loads(ai_text[start:end + 1]), True
+        except ValueError:
+            pass
+    
+    # If JSON parsing fails, return raw text
+    return {"analysis": ai_text}, False
+
+
+def _handle_groq_response(response):
+    """Return (ai_suggestions, is_json) from a requests/httpx response; None on an API error"""
+    if response.status_code == 200:
+        return _parse_groq_response(_loads(response.content))
+    else:
+        error_detail = response.text
+        print(f"Groq API error: {response.status_code} - {error_detail}", file=sys.stderr)
+        return None, False
+
+
+def _retry_delay(response, attempt):
+    """Seconds to wait before retry number attempt, honouring Retry-After"""
+    retry_after = response.headers.get('Retry-After') if response is not None else None
+    try:
+        return min(GROQ_MAX_RETRY_AFTER, max(0.0, float(retry_after)))
+    except (TypeError, ValueError):
+        return GROQ_BACKOFF_FACTOR * 2 ** attempt
+
+
+def _query_groq(error_message):
+    """Send an error to the FREE Groq API, returning (ai_suggestions, is_json)"""
+    try:
+        api_key = os.getenv('GROQ_API_KEY')
+        if not api_key:
+            return None, False
+        
+        session = _get_session()
+        
+        headers = {
+            "Authorization": f"Bearer {api_key}"
         }
         
-        response = requests.post(url, headers=headers, json=data, timeout=30)
+        data = _build_groq_payload(error_message)
         
-        if response.status_code == 200:
-            result = response.json()
-            ai_text = result['choices'][0]['message']['content']
-            
-            # Clean up response - remove markdown if present
-            ai_text = ai_text.strip()
-            if '```json' in ai_text:
-                ai_text = ai_text.split('```json')[1].split('```')[0]
-            elif '```' in ai_text:
-                ai_text = ai_text.split('```')[1].split('```')[0]
+        response = session.post(GROQ_URL, headers=headers, json=data, timeout=(5, 30))
+        
+        return _handle_groq_response(response)
             
-            # Parse JSON
+    except Exception as e:
+        print(f"Error calling Groq API: {e}", file=sys.stderr)
+        return None, False
+
+
+def analyze_error_with_groq(error_message):
+    """Analyze error using FREE Groq API, reusing cached analyses"""
+    key = _normalize_error(error_message)
+    
+    cached = _cache_get(key)
+    if cached is not None:
+        return cached
+    
+    embedding = _embed(error_message)
+    cached = _semantic_get(error_message, embedding)
+    if cached is not None:
+        return cached
+    
+    ai_suggestions, is_json = _query_groq(error_message)
+    # Unparsed replies are one-off; caching them would serve them on every later run
+    if ai_suggestions and is_json:
+        _cache_put(key, ai_suggestions)
+        _save_cache()
+        if _semantic_put(error_message, embedding, ai_suggestions):
+            _save_semantic_cache()
+    
+    return ai_suggestions
+
+
+async def _query_groq_async(client, error_message):
+    """Send an error to the FREE Groq API on a shared httpx.AsyncClient, returning (ai_suggestions, is_json)"""
+    try:
+        import httpx
+        
+        data = _build_groq_payload(error_message)
+        
+        # Same policy as the sync session: retry connection failures and 429/5xx,
+        # but never a read timeout, since that means the model was generating
+        for attempt in range(GROQ_MAX_RETRIES + 1):
+            response = None
             try:
-                ai_suggestions = json.loads(ai_text.strip())
-                return ai_suggestions
-            except json.JSONDecodeError:
-                # If JSON parsing fails, return raw text
-                return {"analysis": ai_text}
-        else:
-            error_detail = response.text
-            print(f"Groq API error: {response.status_code} - {error_detail}", file=sys.stderr)
-            return None
+                response = await client.post(GROQ_URL, json=data, timeout=30)
+            except (httpx.ConnectError, httpx.ConnectTimeout):
+                if attempt == GROQ_MAX_RETRIES:
+                    raise
+            else:
+                if response.status_code not in GROQ_RETRY_STATUSES or attempt == GROQ_MAX_RETRIES:
+                    break
+            await asyncio.sleep(_retry_delay(response, attempt))
+        
+        return _handle_groq_response(response)
             
     except Exception as e:
         print(f"Error calling Groq API: {e}", file=sys.stderr)
-        return None
+        return None, False
 
 
-def get_fallback_suggestions(error_type):
-    """Provide fallback suggestions when AI is unavailable"""
+async def _analyze_errors_with_groq_async(error_messages):
+    """Run Groq analyses for several errors concurrently"""
+    ai_results = [_cache_get(_normalize_error(message)) for message in error_messages]
+    embeddings = {}
+    for i, message in enumerate(error_messages):
+        if ai_results[i] is None:
+            embeddings[i] = _embed(message)
+            ai_results[i] = _semantic_get(message, embeddings[i])
     
-    common_suggestions = {
-        "SyntaxError": [
-            "Check for missing parentheses, brackets, or quotes",
-            "Verify proper indentation (Python requires consistent indentation)",
-            "Look for unclosed code blocks or missing colons after function/class definitions"
-        ],
-        "ImportError": [
-            "Verify the module is installed: pip install <module_name>",
-            "Check if the module name is spelled correctly",
-            "Ensure the module is in your Python path or virtual environment"
-        ],
-        "ModuleNotFoundError": [
-            "Install the missing module: pip install <module_name>",
-            "Check your virtual environment is activated",
-            "Verify the package name (some packages have different import names)"
-        ],
-        "NameError": [
-            "Check if the variable is defined before use",
-            "Verify the variable name spelling (Python is case-sensitive)",
-            "Ensure the variable is in the correct scope (not defined inside a function when used outside)"
-        ],
-        "TypeError": [
-            "Check the data types being used in the operation",
-            "Verify function arguments match expected types",
-            "Look for missing or extra function arguments"
-        ],
-        "AttributeError": [
-            "Verify the object has the attribute you are trying to access",
-            "Check for typos in attribute names",
-            "Ensure the object is properly initialized before accessing attributes"
-        ],
-        "IndexError": [
-            "Check that your index is within the valid range of the list/array",
-            "Remember that Python uses 0-based indexing",
-            "Verify the list/array is not empty before accessing elements"
-        ],
-        "KeyError": [
-            "Check that the dictionary key exists before accessing it",
-            "Use dict.get(key, default) for safer dictionary access",
-            "Verify the key spelling and type (keys are case-sensitive)"
-        ],
-        "ValueError": [
-            "Check that the value being passed is of the correct format",
-            "Verify conversions between data types (e.g., string to integer)",
-            "Ensure the value is within the expected range"
-        ],
-        "default": [
-            "Read the error message carefully for specific clues about the issue",
-            "Check the line number mentioned in the error",
-            "Review recent code changes that might have introduced the error",
-            "Search for the exact error message online for similar cases",
-            "Check documentation for the function or feature causing the error"
-        ]
-    }
+    missing = [i for i, ai_suggestions in enumerate(ai_results) if ai_suggestions is None]
+    if not missing:
+        return ai_results
+    
+    api_key = os.getenv('GROQ_API_KEY')
+    if not api_key:
+        return ai_results
     
-    return common_suggestions.get(error_type, common_suggestions["default"])
+    try:
+        import httpx
+        
+        client = httpx.AsyncClient(
+            headers={
+                "Authorization": f"Bearer {api_key}",
+                "Content-Type": "application/json"
+            },
+            limits=httpx.Limits(max_connections=10, max_keepalive_connections=10),
+            http2=True,
+            timeout=30.0
+        )
+    except Exception as e:
+        print(f"Error creating Groq client: {e}", file=sys.stderr)
+        return ai_results
+    
+    # Messages that normalize to the same key only need one request
+    missing_by_key = {}
+    for i in missing:
+        missing_by_key.setdefault(_normalize_error(error_messages[i]), []).append(i)
+    
+    async with client:
+        fetched = await asyncio.gather(*[
+            _query_groq_async(client, error_messages[indices[0]])
+            for indices in missing_by_key.values()
+        ])
+    
+    stored_embeddings = False
+    for (key, indices), (ai_suggestions, is_json) in zip(missing_by_key.items(), fetched):
+        for i in indices:
+            ai_results[i] = ai_suggestions
+        # Unparsed replies are one-off; caching them would serve them on every later run
+        if not (ai_suggestions and is_json):
+            continue
+        _cache_put(key, ai_suggestions)
+        first = indices[0]
+        if _semantic_put(error_messages[first], embeddings[first], ai_suggestions):
+            stored_embeddings = True
+    
+    _save_cache()
+    if stored_embeddings:
+        _save_semantic_cache()
+    return ai_results
 
 
-def analyze_error(error_message):
-    """Main function to analyze errors with AI and fallback"""
+# Fallback suggestions by error type, built once rather than on every call
+_COMMON_SUGGESTIONS = {
+    "SyntaxError": (
+        "Check for missing parentheses, brackets, or quotes",
+        "Verify proper indentation (Python requires consistent indentation)",
+        "Look for unclosed code blocks or missing colons after function/class definitions"
+    ),
+    "ImportError": (
+        "Verify the module is installed: pip install <module_name>",
+        "Check if the module name is spelled correctly",
+        "Ensure the module is in your Python path or virtual environment"
+    ),
+    "ModuleNotFoundError": (
+        "Install the missing module: pip install <module_name>",
+        "Check your virtual environment is activated",
+        "Verify the package name (some packages have different import names)"
+    ),
+    "NameError": (
+        "Check if the variable is defined before use",
+        "Verify the variable name spelling (Python is case-sensitive)",
+        "Ensure the variable is in the correct scope (not defined inside a function when used outside)"
+    ),
+    "TypeError": (
+        "Check the data types being used in the operation",
+        "Verify function arguments match expected types",
+        "Look for missing or extra function arguments"
+    ),
+    "AttributeError": (
+        "Verify the object has the attribute you are trying to access",
+        "Check for typos in attribute names",
+        "Ensure the object is properly initialized before accessing attributes"
+    ),
+    "IndexError": (
+        "Check that your index is within the valid range of the list/array",
+        "Remember that Python uses 0-based indexing",
+        "Verify the list/array is not empty before accessing elements"
+    ),
+    "KeyError": (
+        "Check that the dictionary key exists before accessing it",
+        "Use dict.get(key, default) for safer dictionary access",
+        "Verify the key spelling and type (keys are case-sensitive)"
+    ),
+    "ValueError": (
+        "Check that the value being passed is of the correct format",
+        "Verify conversions between data types (e.g., string to integer)",
+        "Ensure the value is within the expected range"
+    ),
+    "default": (
+        "Read the error message carefully for specific clues about the issue",
+        "Check the line number mentioned in the error",
+        "Review recent code changes that might have introduced the error",
+        "Search for the exact error message online for similar cases",
+        "Check documentation for the function or feature causing the error"
+    )
+}
+
+
+def get_fallback_suggestions(error_type):
+    """Provide fallback suggestions when AI is unavailable"""
+    return _COMMON_SUGGESTIONS.get(error_type, _COMMON_SUGGESTIONS["default"])
+
+
+def _build_result(error_message, ai_suggestions):
+    """Combine AI suggestions (or fallback) into the analyzer result"""
     
     # Extract error type from message
-    error_type = error_message.split(':')[0].strip() if ':' in error_message else "Unknown"
+    error_type = _extract_error_type(error_message)
     
     result = {
         "success": True,
@@ -161,9 +624,6 @@ def analyze_error(error_message):
         "ai_provider": "groq-llama-3.3-70b"
     }
     
-    # Try AI analysis first
-    ai_suggestions = analyze_error_with_groq(error_message)
-    
     if ai_suggestions:
         result["ai_suggestions"] = ai_suggestions
         result["fallback_used"] = False
@@ -177,16 +637,46 @@ def analyze_error(error_message):
     return result
 
 
+def analyze_error(error_message):
+    """Main function to analyze errors with AI and fallback"""
+    
+    # Try AI analysis first
+    ai_suggestions = analyze_error_with_groq(error_message)
+    
+    return _build_result(error_message, ai_suggestions)
+
+
+async def analyze_errors_async(error_messages):
+    """Analyze several errors concurrently with AI and fallback"""
+    
+    ai_results = await _analyze_errors_with_groq_async(error_messages)
+    
+    return [
+        _build_result(message, ai_suggestions)
+        for message, ai_suggestions in zip(error_messages, ai_results)
+    ]
+
+
+def analyze_errors(error_messages):
+    """Synchronous wrapper around analyze_errors_async"""
+    return asyncio.run(analyze_errors_async(error_messages))
+
+
 if __name__ == '__main__':
     if len(sys.argv) < 2:
         print("Usage: python error_analyzer.py \"error message\"")
         print("\nExample:")
         print('  python error_analyzer.py "ImportError: No module named flask"')
+        print("\nSeveral messages are analyzed concurrently:")
+        print('  python error_analyzer.py "NameError: x" "KeyError: y"')
         sys.exit(1)
     
-    error_message = sys.argv[1]
+    error_messages = sys.argv[1:]
     
-    result = analyze_error(error_message)
+    if len(error_messages) == 1:
+        result = analyze_error(error_messages[0])
+    else:
+        result = analyze_errors(error_messages)
     
     # Pretty print JSON output
-    print(json.dumps(result, indent=2))
\ No newline at end of file
+    print(_dumps(result, indent=True))
\ No newline at end of file
@@ -4,20 +4,187 @@ Route Checker Script
 Analyzes application code to verify routing configuration
 """
 
-import json
+import ast
+import mmap
 import re
 import sys
 import os
-from pathlib import Path
+from collections import Counter
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+try:
+    import orjson
+    
+    def _dumps(obj, indent=False):
+        """Serialize obj to a JSON str with orjson"""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode()
+except ImportError:
+    import json
+    
+    def _dumps(obj, indent=False):
+        """Serialize obj to a JSON str with the standard library"""
+        return json.dumps(obj, indent=2 if indent else None)
+
+# Patterns run over raw file bytes so files never need to be decoded whole
+
+# Flask route decorator, plus the function it decorates when one follows directly
+FLASK_ROUTE_RE = re.compile(
+    rb'@(?P<receiver>[\w.]+)\.route\(["\'](?P<path>[^"\']+)["\'][^)]*\)(?:\s*def\s+(?P<fn>\w+))?'
+)
+
+# Express route definition: app.<method>('<path>', handler)
+EXPRESS_ROUTE_RE = re.compile(
+    rb'app\.(?P<method>get|post|put|delete|patch)\(["\'](?P<path>[^"\']+)["\']\s*,'
+)
+
+EXPRESS_METHODS = ('get', 'post', 'put', 'delete', 'patch')
+
+# Cheap substring checks: files containing none of these cannot define routes
+FLASK_ROUTE_MARKERS = (b'.route(',)
+EXPRESS_ROUTE_MARKERS = tuple(b'app.%s(' % method.encode() for method in EXPRESS_METHODS)
+
+# Smaller files are read directly; mmap set-up costs more than it saves for them
+MMAP_MIN_SIZE = 4096
+
+# Python files above this size are regex-scanned through mmap rather than parsed
+AST_MAX_SIZE = 1 << 20
+
+# Directories that never contain application routes
+SKIP_DIRS = frozenset({'.git', 'node_modules', '__pycache__'})
+
+ROUTE_FILE_EXTENSIONS = ('.py', '.js')
+
+# Below this many files, process start-up costs more than parallel parsing saves
+PROCESS_POOL_MIN_FILES = 32
+
+def _decode_groups(match):
+    """Return a match's named groups decoded to str"""
+    return {
+        name: value.decode('utf-8', errors='replace') if value is not None else None
+        for name, value in match.groupdict().items()
+    }
+
+@contextmanager
+def open_source(file_path):
+    """Yield a file's contents as bytes, or as a read-only mmap for larger files"""
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size < MMAP_MIN_SIZE:
+            yield f.read()
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
+
+def contains_any(source, markers):
+    """Return True if any marker occurs in source (bytes or mmap)"""
+    # mmap's `in` only tests single bytes, so use find() for both
+    return any(source.find(marker) != -1 for marker in markers)
+
+def find_route_matches(file_path, pattern, markers=()):
+    """Return the decoded named groups of every match of a bytes pattern in a file"""
+    with open_source(file_path) as source:
+        if markers and not contains_any(source, markers):
+            return []
+        return [_decode_groups(m) for m in pattern.finditer(source)]
+
+def _dotted_name(node):
+    """Return 'app' or 'self.app' for a Name/Attribute chain, else None"""
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        owner = _dotted_name(node.value)
+        return f"{owner}.{node.attr}" if owner else None
+    return None
+
+def _route_methods(decorator):
+    """Return the upper-cased methods=[...] of a route decorator, ('GET',) if absent, else None"""
+    for keyword in decorator.keywords:
+        if keyword.arg != 'methods':
+            continue
+        if not isinstance(keyword.value, (ast.List, ast.Tuple)):
+            return None
+        methods = []
+        for element in keyword.value.elts:
+            if not (isinstance(element, ast.Constant) and isinstance(element.value, str)):
+                return None
+            methods.append(element.value.upper())
+        return tuple(sorted(set(methods)))
+    return ('GET',)
+
+class FlaskRouteVisitor(ast.NodeVisitor):
+    """Collect (receiver, methods, path, function name) for every @<app or blueprint>.route(...) decorator"""
+    
+    def __init__(self):
+        self.routes = []
+    
+    def visit_FunctionDef(self, node):
+        for decorator in node.decorator_list:
+            if (isinstance(decorator, ast.Call)
+                    and isinstance(decorator.func, ast.Attribute)
+                    and decorator.func.attr == 'route'
+                    and decorator.args
+                    and isinstance(decorator.args[0], ast.Constant)
+                    and isinstance(decorator.args[0].value, str)):
+                receiver = _dotted_name(decorator.func.value)
+                methods = _route_methods(decorator)
+                self.routes.append((receiver, methods, decorator.args[0].value, node.name))
+        self.generic_visit(node)
+    
+    visit_AsyncFunctionDef = visit_FunctionDef
+
+def _find_flask_routes_by_regex(source):
+    """Return (receiver, ('GET',), path, function name or None) for each @<receiver>.route decorator in source"""
+    # methods=[...] is not parsed here, so every route is taken as the GET default
+    return [
+        (match['receiver'], ('GET',), match['path'], match['fn'])
+        for match in map(_decode_groups, FLASK_ROUTE_RE.finditer(source))
+    ]
+
+def find_flask_routes(file_path):
+    """
+    Return (receiver, methods, path, function name or None) for each Flask route in a file
+    
+    receiver is the object the route is registered on ('app' or a blueprint
+    name), since the same path on two blueprints is two different URLs.
+    methods is a sorted tuple, or None when methods= is not a literal list.
+    """
+    with open_source(file_path) as source:
+        if not contains_any(source, FLASK_ROUTE_MARKERS):
+            return []
+        # Parsing needs a full in-memory copy plus an AST several times its size,
+        # so very large files are scanned in place over the mmap instead
+        if len(source) > AST_MAX_SIZE:
+            return _find_flask_routes_by_regex(source)
+        try:
+            tree = ast.parse(source[:])
+        except (SyntaxError, ValueError):
+            # Not valid Python (yet); fall back to the decorator regex
+            return _find_flask_routes_by_regex(source)
+    
+    visitor = FlaskRouteVisitor()
+    visitor.visit(tree)
+    return visitor.routes
+
+def find_duplicate_routes(routes):
+    """Return the routes that appear more than once"""
+    return [route for route, count in Counter(routes).items() if count > 1]
 
 def check_flask_routes(file_path):
     """Check Flask application routes"""
     try:
-        with open(file_path, 'r') as f:
-            code = f.read()
-        
-        # Find Flask route decorators
-        routes = re.findall(r'@app\.route\(["\'](.+?)["\']\)', code)
+        # Find Flask route decorators and their functions
+        routes = []
+        qualified_routes = []
+        route_functions = []
+        method_routes = []
+        for receiver, methods, path, function in find_flask_routes(file_path):
+            routes.append(path)
+            qualified_routes.append(f"{receiver}:{path}")
+            # Routes with non-literal methods cannot be compared, so they are left out
+            for method in methods or ():
+                method_routes.append((receiver, method, path))
+            if function:
+                route_functions.append(function)
         
         issues = []
         
@@ -25,19 +192,19 @@ def check_flask_routes(file_path):
         if not routes:
             issues.append("No routes found in application")
         
-        # Check for duplicate routes
-        duplicate_routes = [r for r in routes if routes.count(r) > 1]
+        # Check for duplicate routes on the same app or blueprint and HTTP method
+        duplicate_routes = [path for _, _, path in find_duplicate_routes(method_routes)]
         if duplicate_routes:
             issues.append(f"Duplicate routes found: {set(duplicate_routes)}")
         
         # Check for routes with no function
-        route_functions = re.findall(r'@app\.route\(["\'].+?["\']\)\s*def\s+(\w+)', code)
         if len(routes) != len(route_functions):
             issues.append("Some routes may not have associated functions")
         
         return {
             'routes_valid': len(issues) == 0,
             'routes': routes,
+            'qualified_routes': qualified_routes,
             'route_count': len(routes),
             'issues': issues,
             'framework': 'Flask'
@@ -54,21 +221,24 @@ def check_flask_routes(file_path):
 def check_express_routes(file_path):
     """Check Express.js application routes"""
     try:
-        with open(file_path, 'r') as f:
-            code = f.read()
-        
-        # Find Express route definitions
-        get_routes = re.findall(r'app\.get\(["\'](.+?)["\']\s*,', code)
-        post_routes = re.findall(r'app\.post\(["\'](.+?)["\']\s*,', code)
-        all_routes = get_routes + post_routes
+        # Find Express route definitions, bucketed by HTTP method
+        routes_by_method = {method: [] for method in EXPRESS_METHODS}
+        for match in find_route_matches(file_path, EXPRESS_ROUTE_RE, EXPRESS_ROUTE_MARKERS):
+            routes_by_method[match['method']].append(match['path'])
+        all_routes = [r for method in EXPRESS_METHODS for r in routes_by_method[method]]
         
         issues = []
         
         if not all_routes:
             issues.append("No routes found in application")
         
-        # Check for duplicate routes
-        duplicate_routes = [r for r in all_routes if all_routes.count(r) > 1]
+        # Check for duplicate routes; the same path under another method is a separate route
+        method_routes = [
+            f"{method}:{path}" for method in EXPRESS_METHODS for path in routes_by_method[method]
+        ]
+        duplicate_routes = [
+            route.split(':', 1)[1] for route in find_duplicate_routes(method_routes)
+        ]
         if duplicate_routes:
             issues.append(f"Duplicate routes found: {set(duplicate_routes)}")
         
@@ -76,8 +246,11 @@ def check_express_routes(file_path):
             'routes_valid': len(issues) == 0,
             'routes': all_routes,
             'route_count': len(all_routes),
-            'get_routes': len(get_routes),
-            'post_routes': len(post_routes),
+            'get_routes': len(routes_by_method['get']),
+            'post_routes': len(routes_by_method['post']),
+            'put_routes': len(routes_by_method['put']),
+            'delete_routes': len(routes_by_method['delete']),
+            'patch_routes': len(routes_by_method['patch']),
             'issues': issues,
             'framework': 'Express.js'
         }
@@ -90,28 +263,55 @@ def check_express_routes(file_path):
             'framework': 'Unknown'
         }
 
+def walk_route_files(root):
+    """Yield (path, extension) for every .py/.js file under root in one scandir pass"""
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in SKIP_DIRS:
+                            stack.append(entry.path)
+                    elif entry.name.endswith(ROUTE_FILE_EXTENSIONS):
+                        yield entry.path, entry.name[-3:]
+        except OSError:
+            continue
+
+def _executor_for(file_count):
+    """Use processes for large scans; threads avoid process start-up for small ones"""
+    if file_count < PROCESS_POOL_MIN_FILES:
+        return ThreadPoolExecutor(max_workers=min(8, file_count))
+    return ProcessPoolExecutor(max_workers=os.cpu_count())
+
 def check_directory_routes(directory_path):
     """Check routes in a directory of files"""
     results = []
     issues = []
     
-    # Look for Python files
-    python_files = list(Path(directory_path).rglob('*.py'))
-    for py_file in python_files:
-        result = check_flask_routes(str(py_file))
-        if result['route_count'] > 0:
-            results.append({
-                'file': str(py_file),
-                'result': result
-            })
+    # Look for Python and JavaScript files
+    python_files = []
+    js_files = []
+    for file_path, extension in walk_route_files(directory_path):
+        if extension == '.py':
+            python_files.append(file_path)
+        else:
+            js_files.append(file_path)
     
-    # Look for JavaScript files
-    js_files = list(Path(directory_path).rglob('*.js'))
-    for js_file in js_files:
-        result = check_express_routes(str(js_file))
+    # Files are independent, so check them in parallel (map keeps file order)
+    file_count = len(python_files) + len(js_files)
+    if file_count:
+        with _executor_for(file_count) as executor:
+            checked = list(zip(python_files, executor.map(check_flask_routes, python_files, chunksize=16)))
+            checked += zip(js_files, executor.map(check_express_routes, js_files, chunksize=16))
+    else:
+        checked = []
+    
+    for file_path, result in checked:
         if result['route_count'] > 0:
             results.append({
-                'file': str(js_file),
+                'file': file_path,
                 'result': result
             })
     
@@ -129,41 +329,59 @@ def check_directory_routes(directory_path):
         'issues': issues
     }
 
-def main():
-    if len(sys.argv) < 2:
-        print(json.dumps({
-            'routes_valid': False,
-            'error': 'No file or directory path provided',
-            'usage': 'python route_checker.py <file_or_directory_path>'
-        }))
-        sys.exit(1)
-    
-    path = sys.argv[1]
-    
+def check_path(path):
+    """Check a file or directory, dispatching on its type"""
     if not os.path.exists(path):
-        print(json.dumps({
+        return {
             'routes_valid': False,
             'error': f'Path does not exist: {path}'
-        }))
-        sys.exit(1)
+        }
     
     # Check if it's a directory or file
     if os.path.isdir(path):
-        result = check_directory_routes(path)
+        return check_directory_routes(path)
+    
+    # Determine file type and check accordingly
+    if path.endswith('.py'):
+        return check_flask_routes(path)
+    elif path.endswith('.js'):
+        return check_express_routes(path)
     else:
-        # Determine file type and check accordingly
-        if path.endswith('.py'):
-            result = check_flask_routes(path)
-        elif path.endswith('.js'):
-            result = check_express_routes(path)
-        else:
-            result = {
-                'routes_valid': False,
-                'error': 'Unsupported file type. Use .py or .js files'
-            }
+        return {
+            'routes_valid': False,
+            'error': 'Unsupported file type. Use .py or .js files'
+        }
+
+def run_batch(lines):
+    """Check each newline-delimited path, writing one JSON result per line"""
+    all_valid = True
+    for line in lines:
+        path = line.strip()
+        if not path:
+            continue
+        result = check_path(path)
+        all_valid = all_valid and result.get('routes_valid', False)
+        sys.stdout.write(_dumps({'path': path, **result}) + '\n')
+        sys.stdout.flush()
+    return all_valid
+
+def main():
+    if '--batch' in sys.argv[1:]:
+        # Keep one interpreter for many files: paths on stdin, JSON lines on stdout
+        sys.exit(0 if run_batch(sys.stdin) else 1)
+    
+    if len(sys.argv) < 2:
+        print(_dumps({
+            'routes_valid': False,
+            'error': 'No file or directory path provided',
+            'usage': 'python route_checker.py <file_or_directory_path>  (or --batch with paths on stdin)'
+        }))
+        sys.exit(1)
+    
+    result = check_path(sys.argv[1])
     
     # Output JSON result
-    print(json.dumps(result, indent=2))
+    print(_dumps(result, indent=True))
     
     # Return appropriate exit code
     sys.exit(0 if result.get('routes_valid', False) else 1)
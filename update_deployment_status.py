@@ -3,79 +3,129 @@
 Update Airtable Deployment Status after GitHub Actions completes
 """
 
+import functools
 import os
+import random
 import sys
 import time
-from pyairtable import Api
-from datetime import datetime
+from operator import itemgetter
 
-def find_deployment_record(table, commit_sha, max_attempts=6, wait_seconds=10):
+# Only records Zapier created in the last 5 minutes can belong to this run
+RECENT_WINDOW_SECONDS = 300
+RECENT_RECORDS_FORMULA = f"DATETIME_DIFF(NOW(), CREATED_TIME(), 'seconds') < {RECENT_WINDOW_SECONDS}"
+
+# Matching only needs each record's id and createdTime, so fetch a single field
+LOOKUP_FIELDS = ['Build Status']
+
+# How find_deployment_record identifies this run's record:
+#   recent - the newest record created in the last 5 minutes
+#   sha    - the newest record whose Commit SHA is this commit (full or 7+ char prefix)
+MATCH_STRATEGIES = ('recent', 'sha')
+
+
+def _commit_sha_formula(commit_sha):
+    """Airtable formula matching records whose Commit SHA is a prefix of commit_sha"""
+    escaped_sha = commit_sha.replace('\\', '\\\\').replace("'", "\\'")
+    return f"AND(LEN({{Commit SHA}}) >= 7, FIND({{Commit SHA}}, '{escaped_sha}') = 1)"
+
+
+def __getattr__(name):
+    """Import pyairtable's Api on first access rather than at module load"""
+    if name == 'Api':
+        from pyairtable import Api
+        return Api
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@functools.lru_cache(maxsize=4)
+def _get_table(api_key, base_id, table_id):
+    """Return a cached Airtable table so repeated calls share one HTTP session"""
+    # pyairtable (and requests under it) is slow to import, so only load it when needed
+    from pyairtable import Api
+    from requests.adapters import HTTPAdapter
+    
+    api = Api(api_key)
+    
+    # Widen the connection pool, keeping pyairtable's retry policy
+    retries = api.session.get_adapter('https://api.airtable.com').max_retries
+    api.session.mount('https://', HTTPAdapter(pool_maxsize=8, max_retries=retries))
+    
+    return api.table(base_id, table_id)
+
+
+def find_deployment_record(table, commit_sha, max_attempts=8, initial_wait=1, max_wait=15,
+                           *, strategy='recent'):
     """
-    Find the deployment record by timestamp (most recent within last 5 minutes)
+    Find the deployment record, by timestamp (most recent within last 5 minutes)
+    or by commit SHA
+    
+    The first lookup happens immediately; later ones back off exponentially
+    so a record Zapier has already delivered is found without waiting. With
+    the defaults the waits are 1, 2, 4, 8, 15, 15, 15s (about 60s in total),
+    so late deliveries are still caught.
     
     Args:
         table: Airtable table object
-        commit_sha: Commit SHA (for logging only)
+        commit_sha: Commit SHA (matched with strategy 'sha', otherwise for logging only)
         max_attempts: Number of retry attempts
-        wait_seconds: Seconds to wait between attempts
+        initial_wait: Seconds to wait after the first attempt, doubled each retry
+        max_wait: Upper bound on the wait between attempts
+        strategy: One of MATCH_STRATEGIES (keyword-only)
     """
     
-    from datetime import datetime, timedelta
+    from datetime import datetime
     import time
     
-    short_sha = commit_sha[:7]
+    if strategy == 'sha':
+        formula = _commit_sha_formula(commit_sha)
+        fields = ['Commit SHA']
+        description = f"deployment for commit {commit_sha[:7]}"
+    elif strategy == 'recent':
+        formula = RECENT_RECORDS_FORMULA
+        fields = LOOKUP_FIELDS
+        description = "recent deployment"
+    else:
+        raise ValueError(f"Unknown match strategy '{strategy}', expected one of {MATCH_STRATEGIES}")
     
     for attempt in range(1, max_attempts + 1):
-        print(f"Attempt {attempt}/{max_attempts}: Looking for recent deployment...")
+        print(f"Attempt {attempt}/{max_attempts}: Looking for {description}...")
         
-        # Get all records
-        all_records = table.all()
+        # Let Airtable filter to matching records instead of downloading the whole table
+        records = table.all(formula=formula, fields=fields)
         
-        if not all_records:
-            print("  No records found")
+        if not records:
+            print("  No matching record found")
             if attempt < max_attempts:
-                print(f"  Waiting {wait_seconds} seconds for Zapier...")
-                time.sleep(wait_seconds)
+                # Jitter keeps concurrent jobs from polling Airtable in lockstep
+                delay = min(max_wait, initial_wait * 2 ** (attempt - 1)) + random.uniform(0, 0.5)
+                print(f"  Waiting {delay:.1f} seconds for Zapier...")
+                time.sleep(delay)
                 continue
-            return None
-        
-        # Sort by created time (most recent first)
-        sorted_records = sorted(
-            all_records,
-            key=lambda x: x['createdTime'],
-            reverse=True
-        )
+            break
         
-        # Get the most recent record (created in last 2 minutes)
-        most_recent = sorted_records[0]
-        created_time = datetime.fromisoformat(most_recent['createdTime'].replace('Z', '+00:00'))
+        # Only the newest record is needed; Airtable's UTC ISO timestamps compare as strings
+        most_recent = max(records, key=itemgetter('createdTime'))
+        # createdTime always ends in 'Z', which fromisoformat only accepts from Python 3.11
+        created_time = datetime.fromisoformat(most_recent['createdTime'][:-1] + '+00:00')
         now = datetime.now(created_time.tzinfo)
         age_seconds = (now - created_time).total_seconds()
         
-        print(f"  Most recent record age: {age_seconds:.1f} seconds")
+        print(f"  Found record (created {age_seconds:.1f}s ago)")
         print(f"  Record ID: {most_recent['id']}")
-        
-        # If record is less than 5 minutes old, it's probably ours
-        if age_seconds < 300:  
-            print(f"  Found recent record (created {age_seconds:.1f}s ago)")
-            return most_recent
-        
-        # Wait and retry
-        if attempt < max_attempts:
-            print(f"  No recent record found, waiting {wait_seconds} seconds...")
-            time.sleep(wait_seconds)
+        return most_recent
     
-    print("WARNING: Could not find recent deployment record")
+    print(f"WARNING: No matching record found after {max_attempts} attempts (looked for {description})")
     return None
 
 
-def update_deployment_status(status, commit_sha):
+def update_deployment_status(status, commit_sha, strategy='recent'):
     """
     Update the deployment record in Airtable with build status
     
     Args:
         status: "Success" or "Failed"
         commit_sha: The commit SHA to find the record
+        strategy: How to find the record, one of MATCH_STRATEGIES
     """
     
     api_key = os.getenv('AIRTABLE_API_KEY')
@@ -88,11 +138,10 @@ def update_deployment_status(status, commit_sha):
     
     try:
         # Initialize Airtable API
-        api = Api(api_key)
-        table = api.table(base_id, table_id)
+        table = _get_table(api_key, base_id, table_id)
         
         # Find the record with retries
-        target_record = find_deployment_record(table, commit_sha)
+        target_record = find_deployment_record(table, commit_sha, strategy=strategy)
         
         if not target_record:
             print("ERROR: Could not find deployment record")
@@ -118,15 +167,20 @@ def update_deployment_status(status, commit_sha):
 
 if __name__ == '__main__':
     if len(sys.argv) < 3:
-        print("Usage: python update_deployment_status.py <status> <commit_sha>")
+        print("Usage: python update_deployment_status.py <status> <commit_sha> [recent|sha]")
         sys.exit(1)
     
     status = sys.argv[1]
     commit_sha = sys.argv[2]
+    strategy = sys.argv[3] if len(sys.argv) > 3 else 'recent'
     
     if status not in ["Success", "Failed"]:
         print(f"ERROR: Invalid status '{status}'")
         sys.exit(1)
     
-    success = update_deployment_status(status, commit_sha)
+    if strategy not in MATCH_STRATEGIES:
+        print(f"ERROR: Invalid match strategy '{strategy}'")
+        sys.exit(1)
+    
+    success = update_deployment_status(status, commit_sha, strategy)
     sys.exit(0 if success else 1)
\ No newline at end of file